@@ -1,47 +1,106 @@
-# --- Defined earlier in GUI ---
-ARC_GAP_MM = None              # e.g. 32
-ARC_ENCLOSURE = None           # "VCB", "HCB", "VOA", "HOA"
-WORKING_DISTANCE_MM = None    # e.g. 457
-IS_GROUNDED = None            # True / False
-CLEARING_TIME_S = None        # e.g. 0.08
-
-# ------------------------------------------------------------ #
+import math
+from dataclasses import dataclass
 
 import numpy as np
 import opendssdirect as dss
-import matplotlib.pyplot as plt
+
+# numba is optional; without it the scalar kernels run as plain Python and
+# batch analysis goes through the NumPy array forms instead
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Arc Flash Study Settings (built once by the GUI when the user hits Run)
+
+@dataclass(slots=True, frozen=True)
+class ArcConfig:
+    gap_mm: float                 # e.g. 32
+    enclosure: str                # "VCB", "HCB", "VOA", "HOA"
+    working_distance_mm: float    # e.g. 457
+    clearing_time_s: float        # e.g. 0.08
+    is_grounded: bool             # True / False
+
 
 # PPE Limits (IEEE 1584)
 
-PPE_LIMITS = {
-    "PPE Category 1": 4,
-    "PPE Category 2": 8,
-    "PPE Category 3": 25,
-    "PPE Category 4": 40
-}
+# (label, max incident energy in cal/cm^2), ordered by increasing limit
+_PPE_TABLE = (
+    ("PPE Category 1", 4.0),
+    ("PPE Category 2", 8.0),
+    ("PPE Category 3", 25.0),
+    ("PPE Category 4", 40.0),
+)
 
 
 # OpenDSS Extraction
 
+def _bolted_fault_kA(isc):
+    # Bus.Isc() is the per-node short-circuit current as interleaved re/im
+    # pairs in A; use the largest node magnitude, in kA
+    re_im = np.asarray(isc, dtype=float)
+    if re_im.size == 0:
+        return 0.0
+    return float(np.hypot(re_im[0::2], re_im[1::2]).max()) / 1000.0
+
+
 def extract_arcflash_inputs(bus_name):
     dss.Circuit.SetActiveBus(bus_name)
     V_kV = dss.Bus.kVBase()   # kV base
-    I_bf = dss.Bus.Isc()     # bolted fault current (kA)
+    I_bf = _bolted_fault_kA(dss.Bus.Isc())     # bolted fault current (kA)
     return V_kV, I_bf
 
 
+def extract_arcflash_inputs_all():
+    # One pass over every bus, collected into arrays for the vectorized kernels
+    names = dss.Circuit.AllBusNames()
+    V_kV = np.empty(len(names))
+    I_bf = np.empty(len(names))
+
+    for i, bus_name in enumerate(names):
+        dss.Circuit.SetActiveBus(bus_name)
+        V_kV[i] = dss.Bus.kVBase()
+        I_bf[i] = _bolted_fault_kA(dss.Bus.Isc())
+
+    return names, V_kV, I_bf
+
+
 
 # IEEE 1584-2018 Core
 
-def ieee1584_arcing_current(I_bf, V_kV, gap_mm, enclosure):
-    COEFFS = {
-        "VCB": (-0.153, 0.662, 0.0966),
-        "HCB": (-0.153, 0.662, 0.0966),
-        "VOA": (-0.792, 0.662, 0.0966),
-        "HOA": (-0.792, 0.662, 0.0966),
-    }
+# Arcing current coefficients (k1, k2, k3). Vertical/horizontal orientation
+# doesn't change them, only whether the electrodes are boxed or in open air.
+_COEFFS_BOX = (-0.153, 0.662, 0.0966)
+_COEFFS_OPEN = (-0.792, 0.662, 0.0966)
+_OPEN_AIR = frozenset({"VOA", "HOA"})
+_BOXED = frozenset({"VCB", "HCB"})
+
 
-    k1, k2, k3 = COEFFS[enclosure]
+def _enclosure_coeffs(enclosure):
+    # Resolve once per analysis so the kernels only ever see k1, k2, k3
+    if enclosure in _OPEN_AIR:
+        return _COEFFS_OPEN
+    if enclosure in _BOXED:
+        return _COEFFS_BOX
+    raise ValueError(f"Unknown enclosure type: '{enclosure}'")
+
+
+# 10 ** x is evaluated as exp(x * ln 10), which NumPy vectorizes better than power
+_LN10 = math.log(10.0)
+
+
+# Array forms: broadcast over NumPy inputs, used for the plot sweep
+
+def ieee1584_arcing_current(I_bf, V_kV, gap_mm, enclosure):
+    k1, k2, k3 = _enclosure_coeffs(enclosure)
 
     log_Ia = (
         k1 +
@@ -50,100 +109,192 @@ def ieee1584_arcing_current(I_bf, V_kV, gap_mm, enclosure):
         0.00402 * gap_mm
     )
 
-    return 10 ** log_Ia
+    return np.exp(log_Ia * _LN10)
 
 
 def ieee1584_incident_energy(Ia, V_kV, gap_mm, clearing_time_s, working_distance_mm):
-    En = 10 ** (
+    En = np.exp((
         -0.555 +
         1.081 * np.log10(Ia) +
         0.0011 * gap_mm
+    ) * _LN10)
+
+    # V_kV may be an array of bus voltages, so pick the factor element-wise
+    Cf = np.where(np.asarray(V_kV) >= 1.0, 1.0, 1.5)
+
+    return Cf * En * (clearing_time_s / 0.2) * (610 / working_distance_mm) ** 2
+
+
+# Scalar forms for the per-bus analysis. Coefficients are passed in directly
+# so the compiled functions never touch the enclosure lookup.
+
+@njit(cache=True, fastmath=True)
+def _ieee1584_arcing_current_scalar(I_bf, V_kV, gap_mm, k1, k2, k3):
+    log_Ia = (
+        k1 +
+        k2 * math.log10(I_bf) +
+        k3 * math.log10(V_kV * 1000.0) +
+        0.00402 * gap_mm
     )
 
+    return math.exp(log_Ia * _LN10)
+
+
+@njit(cache=True, fastmath=True)
+def _ieee1584_incident_energy_scalar(Ia, V_kV, gap_mm, clearing_time_s, working_distance_mm):
+    En = math.exp((
+        -0.555 +
+        1.081 * math.log10(Ia) +
+        0.0011 * gap_mm
+    ) * _LN10)
+
     Cf = 1.0 if V_kV >= 1.0 else 1.5
 
-    return Cf * En * (clearing_time_s / 0.2) * (610 / working_distance_mm) ** 2
+    return Cf * En * (clearing_time_s / 0.2) * (610.0 / working_distance_mm) ** 2
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _ieee1584_batch_energy(V_kV, I_bf, gap_mm, clearing_time_s, working_distance_mm, k1, k2, k3):
+    # Every bus is independent, so spread the scalar kernels across threads.
+    # Enclosure only selects k1, k2, k3 and is resolved by the caller.
+    n = V_kV.shape[0]
+    out = np.empty(n)
+
+    for i in prange(n):
+        Ia = _ieee1584_arcing_current_scalar(I_bf[i], V_kV[i], gap_mm, k1, k2, k3)
+        out[i] = _ieee1584_incident_energy_scalar(Ia, V_kV[i], gap_mm, clearing_time_s, working_distance_mm)
+
+    return out
+
 
 # PPE Classification
 
+# Upper energy bound (cal/cm^2, inclusive) of each label; anything above the
+# last threshold falls through to the final label. Only the PPE categories
+# carry a limit, the bands either side of them map to None.
+_PPE_THRESH = np.array([1.2] + [limit for _, limit in _PPE_TABLE])
+_PPE_LABELS = np.array(
+    ["Below arc-flash threshold (No PPE)"]
+    + [label for label, _ in _PPE_TABLE]
+    + ["Above PPE Category 4 (Dangerous)"]
+)
+_PPE_CLASS_LIMITS = np.array(
+    [None] + [limit for _, limit in _PPE_TABLE] + [None],
+    dtype=object,
+)
+
+
 def ppe_category(energy_cal_cm2):
-    if energy_cal_cm2 <= 1.2:
-        return "Below arc-flash threshold (No PPE)"
-    elif energy_cal_cm2 <= 4:
-        return "PPE Category 1"
-    elif energy_cal_cm2 <= 8:
-        return "PPE Category 2"
-    elif energy_cal_cm2 <= 25:
-        return "PPE Category 3"
-    elif energy_cal_cm2 <= 40:
-        return "PPE Category 4"
-    else:
-        return "Above PPE Category 4 (Dangerous)"
+    # Returns (label, limit) together; works element-wise, so a whole array
+    # of bus energies classifies in one call
+    idx = np.searchsorted(_PPE_THRESH, energy_cal_cm2, side="left")
+    return _PPE_LABELS[idx], _PPE_CLASS_LIMITS[idx]
 
 
 
 # Plot Arcing Current + PPE Safe/Unsafe
 
-def plot_arcflash_ppe(V_kV, gap_mm, clearing_time_s, working_distance_mm, enclosure, ppe_limit):
-    Ibf_range = np.linspace(1, 50, 300)
+# Figure and artists are kept between runs so repeated GUI clicks redraw in place
+_PLOT_CACHE = {}
+
 
-    Ia_vals = np.array([
-        ieee1584_arcing_current(i, V_kV, gap_mm, enclosure)
-        for i in Ibf_range
-    ])
+def plot_arcflash_ppe(V_kV, gap_mm, clearing_time_s, working_distance_mm, enclosure, ppe_limit, block=None):
+    # Imported here so non-plotting callers don't pay for matplotlib at startup
+    import matplotlib.pyplot as plt
 
-    energies = np.array([
-        ieee1584_incident_energy(Ia, V_kV, gap_mm, clearing_time_s, working_distance_mm)
-        for Ia in Ia_vals
-    ])
+    Ibf_range = np.geomspace(1, 50, 300)
 
-    safe = energies <= ppe_limit
-    unsafe = energies > ppe_limit
+    # Energy is a power law in I_bf (E = K * I_bf ** p), so the safe/unsafe
+    # boundary is a single crossover current. Read K and p off two points
+    # (I_bf = 1 and 10 kA) and insert the crossover into the sweep so both
+    # regions meet exactly.
+    E_1, E_10 = ieee1584_incident_energy(
+        ieee1584_arcing_current(np.array([1.0, 10.0]), V_kV, gap_mm, enclosure),
+        V_kV, gap_mm, clearing_time_s, working_distance_mm
+    )
+    p = math.log10(E_10 / E_1)
+    Ibf_star = min(max((ppe_limit / E_1) ** (1 / p), 1.0), 50.0)
 
-    plt.figure(figsize=(9, 5))
-    plt.plot(Ibf_range, Ia_vals, label="Arcing Current (kA)")
-    plt.fill_between(Ibf_range, 0, Ia_vals, where=safe, alpha=0.3, label="Safe Region")
-    plt.fill_between(Ibf_range, 0, Ia_vals, where=unsafe, alpha=0.3, label="Unsafe Region")
+    split = np.searchsorted(Ibf_range, Ibf_star)
+    Ibf_range = np.insert(Ibf_range, split, Ibf_star)
 
-    plt.xlabel("Bolted Fault Current (kA)")
-    plt.ylabel("Arcing Current (kA)")
-    plt.title("Arcing Current vs PPE Safe/Unsafe Region")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    # The arcing current kernel broadcasts, so evaluate the whole sweep at once
+    Ia_vals = ieee1584_arcing_current(Ibf_range, V_kV, gap_mm, enclosure)
 
+    fig = _PLOT_CACHE.get("fig")
 
+    if fig is None or not plt.fignum_exists(fig.number):
+        # First run (or the window was closed): build the figure once
+        fig, ax = plt.subplots(figsize=(9, 5))
+        line, = ax.plot(Ibf_range, Ia_vals, label="Arcing Current (kA)")
 
-# Main GUI-Triggered Function
+        ax.set_xlabel("Bolted Fault Current (kA)")
+        ax.set_ylabel("Arcing Current (kA)")
+        ax.set_title("Arcing Current vs PPE Safe/Unsafe Region")
+        ax.grid(True)
+
+        _PLOT_CACHE.clear()
+        _PLOT_CACHE.update(fig=fig, ax=ax, line=line, fills=())
+        new_figure = True
+    else:
+        ax = _PLOT_CACHE["ax"]
+        line = _PLOT_CACHE["line"]
+        line.set_data(Ibf_range, Ia_vals)
+        new_figure = False
+
+    # Fill polygons can't be reshaped in place, so swap them out
+    for fill in _PLOT_CACHE["fills"]:
+        fill.remove()
+
+    _PLOT_CACHE["fills"] = (
+        ax.fill_between(Ibf_range[:split + 1], 0, Ia_vals[:split + 1], color="C1", alpha=0.3, label="Safe Region"),
+        ax.fill_between(Ibf_range[split:], 0, Ia_vals[split:], color="C2", alpha=0.3, label="Unsafe Region"),
+    )
+
+    ax.relim()
+    ax.autoscale_view()
+    ax.legend()
+
+    if new_figure:
+        fig.tight_layout()
+        # A plain script has no event loop to keep the window up, so block on
+        # the new window like plt.show() always did. With an event loop running
+        # (interactive mode, or block=False from a GUI) return and redraw in place.
+        if block is None:
+            block = not plt.isinteractive()
+        plt.show(block=block)
 
-def run_arcflash_analysis(bus_name):
-    # These are expected to be set earlier by GUI
-    assert ARC_GAP_MM is not None
-    assert ARC_ENCLOSURE is not None
-    assert WORKING_DISTANCE_MM is not None
-    assert CLEARING_TIME_S is not None
+    fig.canvas.draw_idle()
 
+
+
+# Main GUI-Triggered Function
+
+def run_arcflash_analysis(bus_name, cfg: ArcConfig):
     V_kV, I_bf = extract_arcflash_inputs(bus_name)
 
-    Ia = ieee1584_arcing_current(
+    # the fastmath kernels assume finite logs, so never hand them a zero
+    if I_bf <= 0 or V_kV <= 0:
+        raise ValueError(f"No fault data for bus '{bus_name}' (run a fault study first)")
+
+    k1, k2, k3 = _enclosure_coeffs(cfg.enclosure)
+
+    Ia = _ieee1584_arcing_current_scalar(
         I_bf,
         V_kV,
-        ARC_GAP_MM,
-        ARC_ENCLOSURE
+        cfg.gap_mm,
+        k1, k2, k3
     )
 
-    E = ieee1584_incident_energy(
+    E = _ieee1584_incident_energy_scalar(
         Ia,
         V_kV,
-        ARC_GAP_MM,
-        CLEARING_TIME_S,
-        WORKING_DISTANCE_MM
+        cfg.gap_mm,
+        cfg.clearing_time_s,
+        cfg.working_distance_mm
     )
 
-    ppe = ppe_category(E)
+    ppe, ppe_limit = ppe_category(E)
 
     print("===== ARC FLASH RESULTS =====")
     print(f"Bus: {bus_name}")
@@ -153,12 +304,56 @@ def run_arcflash_analysis(bus_name):
     print(f"Incident Energy: {E:.2f} cal/cm^2")
     print(f"PPE Requirement: {ppe}")
 
-    if ppe in PPE_LIMITS:
+    if ppe_limit is not None:
         plot_arcflash_ppe(
             V_kV,
-            ARC_GAP_MM,
-            CLEARING_TIME_S,
-            WORKING_DISTANCE_MM,
-            ARC_ENCLOSURE,
-            PPE_LIMITS[ppe]
-        )
\ No newline at end of file
+            cfg.gap_mm,
+            cfg.clearing_time_s,
+            cfg.working_distance_mm,
+            cfg.enclosure,
+            ppe_limit
+        )
+
+
+# Batch analysis over every bus in the compiled circuit
+
+def run_arcflash_analysis_all(cfg: ArcConfig):
+    names, V_kV, I_bf = extract_arcflash_inputs_all()
+
+    # Buses without a fault current or voltage base (e.g. nothing reported by
+    # the fault study) get NaN energy and no label; keeping them out of the
+    # kernels means log10(0) never reaches the fastmath code
+    valid = (I_bf > 0) & (V_kV > 0)
+    E = np.full(len(names), np.nan)
+
+    if HAS_NUMBA:
+        k1, k2, k3 = _enclosure_coeffs(cfg.enclosure)
+        E[valid] = _ieee1584_batch_energy(
+            V_kV[valid],
+            I_bf[valid],
+            cfg.gap_mm,
+            cfg.clearing_time_s,
+            cfg.working_distance_mm,
+            k1, k2, k3
+        )
+    else:
+        Ia = ieee1584_arcing_current(I_bf[valid], V_kV[valid], cfg.gap_mm, cfg.enclosure)
+        E[valid] = ieee1584_incident_energy(
+            Ia,
+            V_kV[valid],
+            cfg.gap_mm,
+            cfg.clearing_time_s,
+            cfg.working_distance_mm
+        )
+
+    ppe = np.full(len(names), None, dtype=object)
+    ppe[valid] = ppe_category(E[valid])[0]
+
+    print("===== ARC FLASH RESULTS (ALL BUSES) =====")
+    for bus_name, e, label in zip(names, E, ppe):
+        if label is None:
+            print(f"{bus_name:<16} {'':>8}             no fault data")
+        else:
+            print(f"{bus_name:<16} {e:8.2f} cal/cm^2   {label}")
+
+    return names, E, ppe
@@ -2,23 +2,27 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 # set up data structures to keep things uniform
+# network elements are immutable and slotted, so large models stay compact
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Bus:
     bus_id: str
     kv: float
+    zone: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Line:
     line_id: str
     from_bus: str
     to_bus: str
     r_ohm: float
     x_ohm: float
+    length: Optional[float] = None
+    linecode: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transformer:
     tx_id: str
     primary_bus: str
@@ -36,24 +40,30 @@ class SystemModel:
     transformers: Dict[str, Transformer] = field(default_factory=dict)
 
     def validate(self) -> None:
-        # make sure all lines have end points
+        # collect every bus reference from lines and transformers in one pass each
+        bus_keys = set(self.buses)
+
+        from_refs = {line.from_bus for line in self.lines.values()}
+        to_refs = {line.to_bus for line in self.lines.values()}
+        prim_refs = {tx.primary_bus for tx in self.transformers.values()}
+        sec_refs = {tx.secondary_bus for tx in self.transformers.values()}
+
+        missing = (from_refs | to_refs | prim_refs | sec_refs) - bus_keys
+        if not missing:
+            return
+
+        # report every offending element at once
+        problems = []
         for line in self.lines.values():
-            if line.from_bus not in self.buses:
-                raise ValueError(
-                    f"Line '{line.line_id}' references unknown from_bus '{line.from_bus}'."
-                )
-            if line.to_bus not in self.buses:
-                raise ValueError(
-                    f"Line '{line.line_id}' references unknown to_bus '{line.to_bus}'."
-                )
-
-        # Cmake sure all transformer buses exist
+            if line.from_bus in missing:
+                problems.append(f"Line '{line.line_id}' references unknown from_bus '{line.from_bus}'.")
+            if line.to_bus in missing:
+                problems.append(f"Line '{line.line_id}' references unknown to_bus '{line.to_bus}'.")
+
         for tx in self.transformers.values():
-            if tx.primary_bus not in self.buses:
-                raise ValueError(
-                    f"Transformer '{tx.tx_id}' references unknown primary_bus '{tx.primary_bus}'."
-                )
-            if tx.secondary_bus not in self.buses:
-                raise ValueError(
-                    f"Transformer '{tx.tx_id}' references unknown secondary_bus '{tx.secondary_bus}'."
-                )
+            if tx.primary_bus in missing:
+                problems.append(f"Transformer '{tx.tx_id}' references unknown primary_bus '{tx.primary_bus}'.")
+            if tx.secondary_bus in missing:
+                problems.append(f"Transformer '{tx.tx_id}' references unknown secondary_bus '{tx.secondary_bus}'.")
+
+        raise ValueError("\n".join(problems))
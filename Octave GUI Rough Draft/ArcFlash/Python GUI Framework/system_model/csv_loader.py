@@ -1,18 +1,20 @@
-import csv
 import pathlib
-from typing import Dict
+from typing import List
+
+import pandas as pd
 
 # import structures from the core file
 from .core import SystemModel, Bus, Line, Transformer
 
 class CsvReader:
-    
+
     # set required fields to make sure necessary information can be read
     REQUIRED_BUS_FIELDS = {"bus_id", "kv"}
     REQUIRED_LINE_FIELDS = {"line_id", "from_bus", "to_bus", "r_ohm", "x_ohm"}
     REQUIRED_TX_FIELDS = {
         "tx_id", "primary_bus", "secondary_bus", "primary_kv", "secondary_kv", "z_percent"
     }
+    ROW_TYPES = ("bus", "line", "transformer")
 
     def load(self, csv_path: str) -> SystemModel:
         model = SystemModel()
@@ -21,77 +23,113 @@ class CsvReader:
         if not path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        with path.open("r", newline="") as f:
-            reader = csv.DictReader(f)
+        # Parse the whole file once; keep_default_na=False leaves blanks as ""
+        # so optional fields behave like before
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+
+        if "type" not in df.columns:
+            raise ValueError("CSV must include a 'type' column indicating 'bus', 'line', or 'transformer'.")
+
+        df["type"] = df["type"].str.strip().str.lower()
 
-            if "type" not in reader.fieldnames:
-                raise ValueError("CSV must include a 'type' column indicating 'bus', 'line', or 'transformer'.")
+        # Skip empty or untyped rows
+        df = df[df["type"] != ""]
 
-            for row in reader:
-                row_type = (row.get("type") or "").strip().lower()
+        unknown = df.loc[~df["type"].isin(self.ROW_TYPES), "type"]
+        if not unknown.empty:
+            raise ValueError(f"Unknown row type '{unknown.iloc[0]}' in CSV.")
 
-                if not row_type:
-                    # Skip empty or untyped rows
-                    continue
+        groups = dict(tuple(df.groupby("type", sort=False)))
 
-                if row_type == "bus":
-                    self._add_bus(model, row)
-                elif row_type == "line":
-                    self._add_line(model, row)
-                elif row_type == "transformer":
-                    self._add_transformer(model, row)
-                else:
-                    raise ValueError(f"Unknown row type '{row_type}' in CSV.")
+        if "bus" in groups:
+            self._add_buses(model, groups["bus"])
+        if "line" in groups:
+            self._add_lines(model, groups["line"])
+        if "transformer" in groups:
+            self._add_transformers(model, groups["transformer"])
 
         model.validate()
         return model
 
-    def _add_bus(self, model: SystemModel, row: Dict[str, str]) -> None:
-        missing = self.REQUIRED_BUS_FIELDS - row.keys()
+    @staticmethod
+    def _column(rows: pd.DataFrame, name: str) -> List[str]:
+        # Optional columns may be absent from the file entirely
+        if name in rows.columns:
+            return rows[name].tolist()
+        return [""] * len(rows)
+
+    @staticmethod
+    def _check_duplicates(ids: pd.Series, label: str) -> None:
+        duplicated = ids[ids.duplicated()]
+        if not duplicated.empty:
+            raise ValueError(f"Duplicate {label} found in CSV: {duplicated.iloc[0]}")
+
+    def _add_buses(self, model: SystemModel, rows: pd.DataFrame) -> None:
+        missing = self.REQUIRED_BUS_FIELDS - set(rows.columns)
         if missing:
             raise ValueError(f"Bus row missing required fields: {missing}")
 
-        bus = Bus(
-            bus_id=str(row["bus_id"]),
-            kv=float(row["kv"]),
-            zone=row.get("zone") or None,
-        )
-        if bus.bus_id in model.buses:
-            raise ValueError(f"Duplicate bus_id found in CSV: {bus.bus_id}")
-        model.buses[bus.bus_id] = bus
-
-    def _add_line(self, model: SystemModel, row: Dict[str, str]) -> None:
-        missing = self.REQUIRED_LINE_FIELDS - row.keys()
+        self._check_duplicates(rows["bus_id"], "bus_id")
+
+        for bus_id, kv, zone in zip(
+            rows["bus_id"].tolist(),
+            rows["kv"].astype(float).tolist(),
+            self._column(rows, "zone"),
+        ):
+            model.buses[bus_id] = Bus(
+                bus_id=bus_id,
+                kv=kv,
+                zone=zone or None,
+            )
+
+    def _add_lines(self, model: SystemModel, rows: pd.DataFrame) -> None:
+        missing = self.REQUIRED_LINE_FIELDS - set(rows.columns)
         if missing:
             raise ValueError(f"Line row missing required fields: {missing}")
 
-        line = Line(
-            line_id=str(row["line_id"]),
-            from_bus=str(row["from_bus"]),
-            to_bus=str(row["to_bus"]),
-            r_ohm=float(row["r_ohm"]),
-            x_ohm=float(row["x_ohm"]),
-            length=float(row["length"]) if row.get("length") else None,
-            linecode=row.get("linecode") or None,
-        )
-        if line.line_id in model.lines:
-            raise ValueError(f"Duplicate line_id found in CSV: {line.line_id}")
-        model.lines[line.line_id] = line
-
-    def _add_transformer(self, model: SystemModel, row: Dict[str, str]) -> None:
-        missing = self.REQUIRED_TX_FIELDS - row.keys()
+        self._check_duplicates(rows["line_id"], "line_id")
+
+        for line_id, from_bus, to_bus, r_ohm, x_ohm, length, linecode in zip(
+            rows["line_id"].tolist(),
+            rows["from_bus"].tolist(),
+            rows["to_bus"].tolist(),
+            rows["r_ohm"].astype(float).tolist(),
+            rows["x_ohm"].astype(float).tolist(),
+            self._column(rows, "length"),
+            self._column(rows, "linecode"),
+        ):
+            model.lines[line_id] = Line(
+                line_id=line_id,
+                from_bus=from_bus,
+                to_bus=to_bus,
+                r_ohm=r_ohm,
+                x_ohm=x_ohm,
+                length=float(length) if length else None,
+                linecode=linecode or None,
+            )
+
+    def _add_transformers(self, model: SystemModel, rows: pd.DataFrame) -> None:
+        missing = self.REQUIRED_TX_FIELDS - set(rows.columns)
         if missing:
             raise ValueError(f"Transformer row missing required fields: {missing}")
 
-        tx = Transformer(
-            tx_id=str(row["tx_id"]),
-            primary_bus=str(row["primary_bus"]),
-            secondary_bus=str(row["secondary_bus"]),
-            primary_kv=float(row["primary_kv"]),
-            secondary_kv=float(row["secondary_kv"]),
-            z_percent=float(row["z_percent"]),
-            tap=float(row["tap"]) if row.get("tap") else None,
-        )
-        if tx.tx_id in model.transformers:
-            raise ValueError(f"Duplicate tx_id found in CSV: {tx.tx_id}")
-        model.transformers[tx.tx_id] = tx
+        self._check_duplicates(rows["tx_id"], "tx_id")
+
+        for tx_id, primary_bus, secondary_bus, primary_kv, secondary_kv, z_percent, tap in zip(
+            rows["tx_id"].tolist(),
+            rows["primary_bus"].tolist(),
+            rows["secondary_bus"].tolist(),
+            rows["primary_kv"].astype(float).tolist(),
+            rows["secondary_kv"].astype(float).tolist(),
+            rows["z_percent"].astype(float).tolist(),
+            self._column(rows, "tap"),
+        ):
+            model.transformers[tx_id] = Transformer(
+                tx_id=tx_id,
+                primary_bus=primary_bus,
+                secondary_bus=secondary_bus,
+                primary_kv=primary_kv,
+                secondary_kv=secondary_kv,
+                z_percent=z_percent,
+                tap=float(tap) if tap else None,
+            )
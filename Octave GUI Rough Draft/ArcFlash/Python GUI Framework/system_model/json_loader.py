@@ -1,8 +1,15 @@
-import json
 import pathlib
 
 from .core import SystemModel, Bus, Line, Transformer
 
+# use orjson's C parser when available, otherwise fall back to the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
 
 class JsonReader:
     def load(self, json_path: str) -> SystemModel:
@@ -12,8 +19,7 @@ class JsonReader:
         if not path.exists():
             raise FileNotFoundError(f"JSON file not found: {json_path}")
 
-        with path.open("r") as f:
-            data = json.load(f)
+        data = _loads(path.read_bytes())
 
         buses = data.get("buses", [])
         lines = data.get("lines", [])
@@ -1,17 +1,52 @@
 # der_storage.py
 
 from __future__ import annotations
-from dataclasses import dataclass, field, asdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import InitVar, dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from sys import intern
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+import copy
 import json
+import pickle
+
+import numpy as np
+
+# orjson parses/writes straight from/to bytes in C; fall back to the stdlib if it's missing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# simdjson lets from_json_file walk the document lazily instead of building it all
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
+# binary config formats for libraries that get reloaded a lot; both optional
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+try:
+    import cbor2
+    HAS_CBOR = True
+except ImportError:
+    HAS_CBOR = False
 
 
 # ---------------------------
 # Low-level config dataclasses
 # ---------------------------
 
-@dataclass
+@dataclass(slots=True)
 class REGCConfig:
     model: str = "REGC_A"
     imax: float = 1.2
@@ -31,7 +66,7 @@ class REGCConfig:
         return self.imax_fault if self.imax_fault is not None else self.imax
 
 
-@dataclass
+@dataclass(slots=True)
 class REECConfig:
     model: str = "REEC_A"
     vref_pu: float = 1.0
@@ -54,29 +89,80 @@ class REECConfig:
     vq_flag: int = 0
 
 
-@dataclass
+# Field defaults, read once so from_dict can build configs with a single dict merge
+_REGC_DEFAULTS = MappingProxyType({f.name: f.default for f in fields(REGCConfig)})
+_REEC_DEFAULTS = MappingProxyType({f.name: f.default for f in fields(REECConfig)})
+
+
+def _intern(value: Any) -> Any:
+    """Intern str values; anything else is passed through for validate() to judge."""
+    return intern(value) if isinstance(value, str) else value
+
+
+def _check_config_keys(data: Dict[str, Any], defaults: MappingProxyType, section: str) -> None:
+    """Raise ValueError if a config section has keys its dataclass doesn't know."""
+    unknown = set(data) - defaults.keys()
+    if unknown:
+        raise ValueError(f"Unknown {section} settings: {sorted(unknown)}")
+
+
+@dataclass(slots=True)
 class VRTPoint:
     voltage_pu: float
     max_time_s: float
 
 
-@dataclass
+@dataclass(slots=True)
 class FRTPoint:
     frequency_hz: float
     max_time_s: float
 
 
-@dataclass
+def _empty_curve() -> np.ndarray:
+    return np.empty((0, 2), dtype=np.float64)
+
+
+def _curve_array(raw: List[Dict[str, float]], x_key: str) -> np.ndarray:
+    """Pack a list of {x_key, max_time_s} points into one (N, 2) float array."""
+    return np.fromiter(
+        (v for pt in raw for v in (pt[x_key], pt["max_time_s"])),
+        dtype=np.float64,
+        count=2 * len(raw),
+    ).reshape(-1, 2)
+
+
+@dataclass(slots=True)
 class RideThroughConfig:
-    vrt_curve: List[VRTPoint] = field(default_factory=list)
-    frt_curve: List[FRTPoint] = field(default_factory=list)
+    # Curves are stored as contiguous (N, 2) arrays rather than lists of points:
+    #   vrt_curve rows are [voltage_pu, max_time_s]
+    #   frt_curve rows are [frequency_hz, max_time_s]
+    vrt_curve: np.ndarray = field(default_factory=_empty_curve)
+    frt_curve: np.ndarray = field(default_factory=_empty_curve)
+
+    def __eq__(self, other: object) -> bool:
+        # the generated __eq__ would compare the arrays element-wise and then
+        # try to truth-test the result, so compare them whole instead
+        if not isinstance(other, RideThroughConfig):
+            return NotImplemented
+        return (
+            np.array_equal(self.vrt_curve, other.vrt_curve)
+            and np.array_equal(self.frt_curve, other.frt_curve)
+        )
+
+    def vrt_points(self) -> List[VRTPoint]:
+        """VRT curve as VRTPoint objects, for callers that want named fields."""
+        return [VRTPoint(voltage_pu=v, max_time_s=t) for v, t in self.vrt_curve.tolist()]
+
+    def frt_points(self) -> List[FRTPoint]:
+        """FRT curve as FRTPoint objects, for callers that want named fields."""
+        return [FRTPoint(frequency_hz=f, max_time_s=t) for f, t in self.frt_curve.tolist()]
 
 
 # ---------------------------
 # High-level DER dataclass
 # ---------------------------
 
-@dataclass
+@dataclass(slots=True)
 class DER:
     """Internal representation of a single DER / inverter-based resource."""
 
@@ -98,12 +184,19 @@ class DER:
 
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Set by trusted internal callers to skip the construction-time checks
+    _unsafe: InitVar[bool] = False
+
+    def __post_init__(self, _unsafe: bool) -> None:
+        if not _unsafe:
+            self.validate()
+
     # ------------- validation & utility methods -------------
 
     def validate(self) -> None:
         """
         Basic sanity checks. Raise ValueError if configuration is clearly invalid.
-        You can expand this over time.
+        Runs automatically on construction unless _unsafe=True is passed.
         """
         if self.mva_rating <= 0:
             raise ValueError("mva_rating must be > 0")
@@ -114,25 +207,89 @@ class DER:
         if not self.connection_bus:
             raise ValueError("connection_bus must be non-empty")
 
+        if not isinstance(self.regc.model, str):
+            raise ValueError("regc.model must be a string")
+
+        if not isinstance(self.reec.model, str):
+            raise ValueError("reec.model must be a string")
+
         if self.regc.imax <= 0:
             raise ValueError("regc.imax must be > 0")
 
         if self.reec.iqmax_pu < 0:
             raise ValueError("reec.iqmax_pu should be >= 0")
 
-        # You can add range checks for vdip/vup, kqv, etc.
+        if not 0 <= self.reec.vdip_pu < self.reec.vup_pu:
+            raise ValueError("reec.vdip_pu must satisfy 0 <= vdip_pu < vup_pu")
+
+        # Curve points are expected in ascending order of voltage / frequency
+        rt = self.ride_through
+        if (np.diff(rt.vrt_curve[:, 0]) < 0).any():
+            raise ValueError("ride_through.vrt_curve must be sorted by voltage_pu")
+
+        if (np.diff(rt.frt_curve[:, 0]) < 0).any():
+            raise ValueError("ride_through.frt_curve must be sorted by frequency_hz")
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize DER to a plain dict (JSON-serializable)."""
-        d = asdict(self)
-        # Convert nested RideThrough curves to dicts explicitly (already dict-like, but being explicit)
-        d["ride_through"]["vrt_curve"] = [
-            asdict(p) for p in self.ride_through.vrt_curve
-        ]
-        d["ride_through"]["frt_curve"] = [
-            asdict(p) for p in self.ride_through.frt_curve
-        ]
-        return d
+        # Built by hand rather than via asdict() to skip the per-field reflection
+        regc = self.regc
+        reec = self.reec
+        rt = self.ride_through
+
+        return {
+            "der_id": self.der_id,
+            "der_type": self.der_type,
+            "connection_bus": self.connection_bus,
+            "mva_rating": self.mva_rating,
+            "kv_ll": self.kv_ll,
+            "pref_MW": self.pref_MW,
+            "qref_MVAR": self.qref_MVAR,
+            "power_factor": self.power_factor,
+
+            "regc": {
+                "model": regc.model,
+                "imax": regc.imax,
+                "imax_fault": regc.imax_fault,
+                "r_source_pu": regc.r_source_pu,
+                "x_source_pu": regc.x_source_pu,
+                "iq_priority": regc.iq_priority,
+                "kp_pll": regc.kp_pll,
+                "ki_pll": regc.ki_pll,
+                "wmax": regc.wmax,
+                "wmin": regc.wmin,
+            },
+
+            "reec": {
+                "model": reec.model,
+                "vref_pu": reec.vref_pu,
+                "qref_pu": reec.qref_pu,
+                "kqv": reec.kqv,
+                "vdip_pu": reec.vdip_pu,
+                "vup_pu": reec.vup_pu,
+                "iqmax_pu": reec.iqmax_pu,
+                "iqmin_pu": reec.iqmin_pu,
+                "pmax_pu": reec.pmax_pu,
+                "pmin_pu": reec.pmin_pu,
+                "pf_flag": reec.pf_flag,
+                "pq_flag": reec.pq_flag,
+                "vq_flag": reec.vq_flag,
+            },
+
+            "ride_through": {
+                "vrt_curve": [
+                    {"voltage_pu": v, "max_time_s": t}
+                    for v, t in rt.vrt_curve.tolist()
+                ],
+                "frt_curve": [
+                    {"frequency_hz": f, "max_time_s": t}
+                    for f, t in rt.frt_curve.tolist()
+                ],
+            },
+
+            # metadata is free-form, so copy it to keep the result independent
+            "metadata": copy.deepcopy(self.metadata),
+        }
 
     def to_sim_payload(self) -> Dict[str, Any]:
         """
@@ -183,8 +340,14 @@ class DER:
             },
 
             "ride_through": {
-                "vrt_curve": [asdict(p) for p in rt.vrt_curve],
-                "frt_curve": [asdict(p) for p in rt.frt_curve],
+                "vrt_curve": [
+                    {"voltage_pu": v, "max_time_s": t}
+                    for v, t in rt.vrt_curve.tolist()
+                ],
+                "frt_curve": [
+                    {"frequency_hz": f, "max_time_s": t}
+                    for f, t in rt.frt_curve.tolist()
+                ],
             }
         }
 
@@ -193,6 +356,19 @@ class DER:
 # DER storage / loader helper
 # ---------------------------
 
+# Part of every pickle-sidecar key, so a sidecar written before a dataclass
+# gained/lost a field or changed a config default is treated as stale rather
+# than unpickled into an object with missing slots. Bump _CACHE_VERSION for
+# any other change to what a cached DER means.
+_CACHE_VERSION = 1
+_CACHE_SCHEMA = (
+    _CACHE_VERSION,
+    tuple(f.name for f in fields(DER)),
+    tuple(f.name for f in fields(RideThroughConfig)),
+    tuple(_REGC_DEFAULTS.items()),
+    tuple(_REEC_DEFAULTS.items()),
+)
+
 class DERStorage:
     """
     Helper to construct DER objects from JSON or dicts and
@@ -201,21 +377,101 @@ class DERStorage:
 
     def __init__(self) -> None:
         self._ders: Dict[str, DER] = {}
+        # read-only live view handed out by all_ders; _ders must only ever be
+        # mutated in place so this stays in sync
+        self._ders_view: Mapping[str, DER] = MappingProxyType(self._ders)
 
     # ---- construction helpers ----
 
     def from_json_file(self, der_id: str, path: str | Path) -> DER:
-        data = self._load_json(path)
-        der = self.from_dict(der_id, data)
+        """
+        Build a DER from a JSON file (or a ".msgpack" / ".cbor" file with the
+        same structure). The built DER is cached in a "<file>.pkl" sidecar
+        and reused while the source file is unchanged.
+
+        The sidecar is read back with pickle.load, which can run arbitrary
+        code, so only load configs from directories you trust.
+        """
+        der = self._build_from_file(der_id, path)
+        self._ders[der_id] = der
         return der
 
-    def from_dict(self, der_id: str, data: Dict[str, Any]) -> DER:
+    def from_dict(self, der_id: str, data: Dict[str, Any], validate: bool = True) -> DER:
         """
         Build a DER object from a dict (e.g., loaded from JSON).
+        Pass validate=False for trusted data to skip the sanity checks.
+        """
+        der = self._build(der_id, data, validate)
+        self._ders[der_id] = der
+        return der
+
+    def from_many_dicts(self, items: Iterable[Tuple[str, Dict[str, Any]]],
+                        validate: bool = True) -> Dict[str, DER]:
+        """
+        Build several DERs from (der_id, dict) pairs and register them together.
+        A der_id repeated within the batch is an error rather than last-one-wins.
+        """
+        items = list(items)
+        ids = [der_id for der_id, _ in items]
+        if len(set(ids)) != len(ids):
+            dupes = sorted(der_id for der_id, n in Counter(ids).items() if n > 1)
+            raise ValueError(f"Duplicate der_id in batch: {', '.join(map(str, dupes))}")
+
+        built = {der_id: self._build(der_id, data, validate) for der_id, data in items}
+        # update() grows the registry once for the whole batch, in place, so the
+        # all_ders view stays valid
+        self._ders.update(built)
+        return built
+
+    def from_many_json(self, paths: Mapping[str, str | Path]) -> Dict[str, DER]:
+        """
+        Build several DERs from a {der_id: path} mapping and register them together.
+        Files are read and parsed on a thread pool; nothing is registered
+        unless every file loads.
+        """
+        with ThreadPoolExecutor() as ex:
+            built = dict(zip(paths, ex.map(self._build_from_file, paths, paths.values())))
+        self._ders.update(built)
+        return built
+
+    def _build_from_file(self, der_id: str, path: str | Path) -> DER:
+        path = Path(path)
+        stat = path.stat()
+        key = (_CACHE_SCHEMA, der_id, stat.st_mtime_ns, stat.st_size)
+        cache_path = path.with_suffix(path.suffix + ".pkl")
+
+        der = self._load_cached(cache_path, key)
+        if der is not None:
+            return der
+
+        if path.suffix in (".msgpack", ".cbor"):
+            data = self._load_binary(path)
+            der = self._build(der_id, data)
+        elif HAS_SIMDJSON:
+            # _build only reads the keys it needs, so hand it the lazy
+            # document and only those subtrees get turned into Python objects.
+            # The document is only valid while its parser is, hence one per call.
+            doc = simdjson.Parser().parse(path.read_bytes())
+            der = self._build(der_id, doc)
+        else:
+            data = self._load_json(path)
+            der = self._build(der_id, data)
+
+        self._store_cached(cache_path, key, der)
+        return der
+
+    def _build(self, der_id: str, data: Dict[str, Any], validate: bool = True) -> DER:
+        """
+        Construct (but don't register) a DER from a dict.
         This is where you map JSON keys into your dataclasses.
         """
-        der_type = data["der_type"]
+        # these repeat across many DERs, so keep one shared copy of each
+        der_type = _intern(data["der_type"])
+        # IEEE-style bus names are often written as bare numbers ("634")
         connection_bus = data["connection_bus"]
+        if isinstance(connection_bus, int):
+            connection_bus = str(connection_bus)
+        connection_bus = _intern(connection_bus)
         mva_rating = data["mva_rating"]
         kv_ll = data.get("kv", data.get("kv_ll"))
 
@@ -225,50 +481,23 @@ class DERStorage:
 
         # REGC config
         regc_data = data.get("regc", {})
-        regc = REGCConfig(
-            model=regc_data.get("model", "REGC_A"),
-            imax=regc_data.get("imax", 1.2),
-            imax_fault=regc_data.get("imax_fault"),
-            r_source_pu=regc_data.get("r_source_pu", 0.01),
-            x_source_pu=regc_data.get("x_source_pu", 0.12),
-            iq_priority=regc_data.get("iq_priority", "reactive"),
-            kp_pll=regc_data.get("kp_pll", 20.0),
-            ki_pll=regc_data.get("ki_pll", 200.0),
-            wmax=regc_data.get("wmax", 2.0),
-            wmin=regc_data.get("wmin", -2.0),
-        )
+        _check_config_keys(regc_data, _REGC_DEFAULTS, "regc")
+        regc = REGCConfig(**{**_REGC_DEFAULTS, **regc_data})
+        regc.model = _intern(regc.model)
 
         # REEC config
         reec_data = data.get("reec", {})
-        reec = REECConfig(
-            model=reec_data.get("model", "REEC_A"),
-            vref_pu=reec_data.get("vref_pu", 1.0),
-            qref_pu=reec_data.get("qref_pu", 0.0),
-            kqv=reec_data.get("kqv", 7.5),
-            vdip_pu=reec_data.get("vdip_pu", 0.9),
-            vup_pu=reec_data.get("vup_pu", 1.1),
-            iqmax_pu=reec_data.get("iqmax_pu", 1.1),
-            iqmin_pu=reec_data.get("iqmin_pu", -1.1),
-            pmax_pu=reec_data.get("pmax_pu", 1.0),
-            pmin_pu=reec_data.get("pmin_pu", 0.0),
-            pf_flag=reec_data.get("pf_flag", 0),
-            pq_flag=reec_data.get("pq_flag", 1),
-            vq_flag=reec_data.get("vq_flag", 0),
-        )
+        _check_config_keys(reec_data, _REEC_DEFAULTS, "reec")
+        reec = REECConfig(**{**_REEC_DEFAULTS, **reec_data})
+        reec.model = _intern(reec.model)
 
         # Ride-through config
         rt_data = data.get("ride_through", {})
         vrt_raw = rt_data.get("vrt_curve", [])
         frt_raw = rt_data.get("frt_curve", [])
 
-        vrt_curve = [
-            VRTPoint(voltage_pu=pt["voltage_pu"], max_time_s=pt["max_time_s"])
-            for pt in vrt_raw
-        ]
-        frt_curve = [
-            FRTPoint(frequency_hz=pt["frequency_hz"], max_time_s=pt["max_time_s"])
-            for pt in frt_raw
-        ]
+        vrt_curve = _curve_array(vrt_raw, "voltage_pu")
+        frt_curve = _curve_array(frt_raw, "frequency_hz")
         ride_through = RideThroughConfig(vrt_curve=vrt_curve, frt_curve=frt_curve)
 
         der = DER(
@@ -283,11 +512,10 @@ class DERStorage:
             regc=regc,
             reec=reec,
             ride_through=ride_through,
-            metadata=data.get("metadata", {})
+            metadata=self._materialize(data.get("metadata", {})),
+            _unsafe=not validate,
         )
 
-        der.validate()
-        self._ders[der_id] = der
         return der
 
     # ---- query methods ----
@@ -295,13 +523,86 @@ class DERStorage:
     def get(self, der_id: str) -> DER:
         return self._ders[der_id]
 
-    def all_ders(self) -> Dict[str, DER]:
-        return dict(self._ders)
+    def all_ders(self) -> Mapping[str, DER]:
+        return self._ders_view
+
+    # ---- persistence ----
+
+    def to_json_file(self, der_id: str, path: str | Path) -> None:
+        """
+        Write a registered DER back out as JSON in the same shape
+        from_json_file reads.
+        """
+        self._dump_json(self._ders[der_id].to_dict(), path)
+
+    @classmethod
+    def convert_json_to_msgpack(cls, path: str | Path) -> Path:
+        """
+        Write a MessagePack copy of a JSON config next to it
+        ("der.json" -> "der.msgpack") and return the new path.
+        """
+        if not HAS_MSGPACK:
+            raise ImportError("msgpack is required to write .msgpack configs, but is not installed.")
+        path = Path(path)
+        out = path.with_suffix(".msgpack")
+        out.write_bytes(msgpack.packb(cls._load_json(path), use_bin_type=True))
+        return out
 
     # ---- internal helpers ----
 
+    @staticmethod
+    def _load_cached(cache_path: Path, key: tuple) -> Optional[DER]:
+        """Return the cached DER if the sidecar matches key, else None."""
+        try:
+            with cache_path.open("rb") as f:
+                cached_key, der = pickle.load(f)
+        except Exception:
+            # missing, unreadable, or pickled against another module path
+            # (layout changes are caught by the schema part of the key);
+            # it's only a cache, so just rebuild
+            return None
+        return der if cached_key == key else None
+
+    @staticmethod
+    def _store_cached(cache_path: Path, key: tuple, der: DER) -> None:
+        # the cache is only an optimization, so a read-only folder is fine
+        try:
+            with cache_path.open("wb") as f:
+                pickle.dump((key, der), f, protocol=5)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _materialize(value: Any) -> Any:
+        """Turn a lazy simdjson object into a plain dict; dicts pass through."""
+        as_dict = getattr(value, "as_dict", None)
+        return as_dict() if as_dict is not None else value
+
     @staticmethod
     def _load_json(path: str | Path) -> Dict[str, Any]:
         path = Path(path)
+        if HAS_ORJSON:
+            return orjson.loads(path.read_bytes())
         with path.open("r") as f:
             return json.load(f)
+
+    @staticmethod
+    def _load_binary(path: Path) -> Dict[str, Any]:
+        if path.suffix == ".msgpack":
+            if not HAS_MSGPACK:
+                raise ImportError(f"msgpack is required to read '{path}', but is not installed.")
+            return msgpack.unpackb(path.read_bytes(), raw=False)
+        if not HAS_CBOR:
+            raise ImportError(f"cbor2 is required to read '{path}', but is not installed.")
+        return cbor2.loads(path.read_bytes())
+
+    @staticmethod
+    def _dump_json(data: Dict[str, Any], path: str | Path) -> None:
+        path = Path(path)
+        if HAS_ORJSON:
+            path.write_bytes(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+            return
+        with path.open("w") as f:
+            json.dump(data, f, indent=2)
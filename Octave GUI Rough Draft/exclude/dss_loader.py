@@ -1,4 +1,6 @@
 import pathlib
+from sys import intern
+from typing import Iterator
 
 from .core import SystemModel, Bus, Line, Transformer
 
@@ -24,6 +26,63 @@ class DssReader:
                 "opendssdirect is required for DssSystemModelLoader, but is not installed."
             )
 
+    @staticmethod
+    def _transformer_rows() -> Iterator[tuple]:
+        """Yield raw (name, bus1, kv1, bus2, kv2, xhl, tap) for each transformer."""
+        transformers = dss.Transformers
+        tx_name = transformers.Name
+        tx_wdg = transformers.Wdg
+        tx_kv = transformers.kV
+        tx_xhl = transformers.Xhl
+        tx_tap = transformers.Tap
+        tx_next = transformers.Next
+        # the transformer is also the active circuit element, whose bus list
+        # has one entry per winding
+        element_buses = dss.CktElement.BusNames
+
+        # iterate a known count rather than relying on an empty name to stop
+        tx_count = transformers.Count()
+        transformers.First()
+        for _ in range(tx_count):
+            name = tx_name()
+
+            # Assume 2-winding transformer for now
+            primary_bus, secondary_bus = element_buses()[:2]
+
+            tx_wdg(1)
+            primary_kv = tx_kv()
+
+            tx_wdg(2)
+            secondary_kv = tx_kv()
+
+            yield name, primary_bus, primary_kv, secondary_bus, secondary_kv, tx_xhl(), tx_tap()
+
+            tx_next()
+
+    @staticmethod
+    def _bus_kv_bases() -> dict:
+        """
+        Base kV (line-to-neutral) for every bus, from the circuit-wide node
+        voltage vectors: base = |V| / |V|pu. Three calls regardless of bus
+        count, instead of SetActiveBus + kVBase per bus.
+
+        Buses without a usable node are left out so the caller can fall back
+        to kVBase: nodes at 0 pu (unsolved or de-energized), and nodes on a
+        bus with no voltage base. For those OpenDSS divides by 1.0 instead of
+        the base, so the "pu" value is just |V| again.
+        """
+        circuit = dss.Circuit
+        kv_bases = {}
+        for node, vmag, vpu in zip(
+            circuit.AllNodeNames(),
+            circuit.AllBusVMag(),
+            circuit.AllBusMagPu(),
+        ):
+            bus_name = node.partition('.')[0]
+            if vpu > 0.0 and vpu != vmag and bus_name not in kv_bases:
+                kv_bases[bus_name] = vmag / vpu / 1000.0
+        return kv_bases
+
     def load(self, dss_master_path: str) -> SystemModel:
         model = SystemModel()
         path = pathlib.Path(dss_master_path)
@@ -44,72 +103,67 @@ class DssReader:
             )
 
         # -------- Buses --------
-        for bus_name in dss.Circuit.AllBusNames():
-            dss.Circuit.SetActiveBus(bus_name)
-            kv_base = dss.Bus.kVBase()
+        circuit = dss.Circuit
+        kv_bases = self._bus_kv_bases()
+
+        # bus names repeat across every line/transformer end, so intern them to
+        # share one string object per bus
+        for bus_name in circuit.AllBusNames():
+            bus_name = intern(bus_name)
+            kv_base = kv_bases.get(bus_name)
+            if kv_base is None:
+                # no energized node to derive the base from; ask the bus directly
+                circuit.SetActiveBus(bus_name)
+                kv_base = dss.Bus.kVBase()
             model.buses[bus_name] = Bus(
                 bus_id=bus_name,
                 kv=kv_base if kv_base is not None else 0.0,
             )
 
         # -------- Lines --------
-        dss.Lines.First()
-        while True:
-            name = dss.Lines.Name()
-            if not name:
-                break
-
-            from_bus = dss.Lines.Bus1().split('.')[0]
-            to_bus = dss.Lines.Bus2().split('.')[0]
-            r_ohm = dss.Lines.R1()
-            x_ohm = dss.Lines.X1()
-            length = dss.Lines.Length()
-            linecode = dss.Lines.LineCode()
+        # bind the getters once so the loop doesn't re-resolve dss.Lines.* each time
+        lines = dss.Lines
+        line_name = lines.Name
+        line_bus1 = lines.Bus1
+        line_bus2 = lines.Bus2
+        line_r1 = lines.R1
+        line_x1 = lines.X1
+        line_length = lines.Length
+        line_code = lines.LineCode
+        line_next = lines.Next
+
+        # iterate a known count rather than relying on an empty name to stop
+        line_count = lines.Count()
+        lines.First()
+        for _ in range(line_count):
+            name = line_name()
+            linecode = line_code()
 
             model.lines[name] = Line(
                 line_id=name,
-                from_bus=from_bus,
-                to_bus=to_bus,
-                r_ohm=r_ohm,
-                x_ohm=x_ohm,
-                length=length,
-                linecode=linecode or None,
+                from_bus=intern(line_bus1().partition('.')[0]),
+                to_bus=intern(line_bus2().partition('.')[0]),
+                r_ohm=line_r1(),
+                x_ohm=line_x1(),
+                length=line_length(),
+                linecode=intern(linecode) if linecode else None,
             )
 
-            if dss.Lines.Next() == 0:
-                break
+            line_next()
 
         # -------- Transformers --------
-        dss.Transformers.First()
-        while True:
-            name = dss.Transformers.Name()
-            if not name:
-                break
-
-            # Assume 2-winding transformer for now
-            dss.Transformers.Wdg(1)
-            primary_bus = dss.Transformers.Bus().split('.')[0]
-            primary_kv = dss.Transformers.kV()
-
-            dss.Transformers.Wdg(2)
-            secondary_bus = dss.Transformers.Bus().split('.')[0]
-            secondary_kv = dss.Transformers.kV()
-
-            z_percent = dss.Transformers.XHL()
-            tap = dss.Transformers.Tap()
-
+        for (
+            name, primary_bus, primary_kv, secondary_bus, secondary_kv, z_percent, tap
+        ) in self._transformer_rows():
             model.transformers[name] = Transformer(
                 tx_id=name,
-                primary_bus=primary_bus,
-                secondary_bus=secondary_bus,
+                primary_bus=intern(primary_bus.partition('.')[0]),
+                secondary_bus=intern(secondary_bus.partition('.')[0]),
                 primary_kv=primary_kv,
                 secondary_kv=secondary_kv,
                 z_percent=z_percent,
                 tap=tap,
             )
 
-            if dss.Transformers.Next() == 0:
-                break
-
         model.validate()
         return model
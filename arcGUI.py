@@ -361,6 +361,12 @@ class App(tk.Tk):
         self.title("DER Arc Flash Analysis Tool")
         self.geometry("1100x700")
 
+        # Shared page-title style, configured once instead of per label.
+        # The nav buttons stay tk.Button: the native Windows/macOS ttk themes
+        # ignore button background and relief.
+        style = ttk.Style(self)
+        style.configure("Title.TLabel", font=("Arial", 20), background="white", foreground="black")
+
         # Set up navigation for menu options
         nav_frame = tk.Frame(self, bg="#123", height=50)
         nav_frame.pack(side="top", fill="x")
@@ -391,19 +397,9 @@ class App(tk.Tk):
         self.container = tk.Frame(self, bg="white")
         self.container.pack(fill="both", expand=True)
 
+        # Pages are built the first time they are shown
         self.pages = {}
 
-        for PageClass in (
-            SystemModelPage,
-            DERSettingsPage,
-            FaultScenarioPage,
-            RunSimulationPage,
-            ResultsPage,
-        ):
-            page = PageClass(self.container)
-            self.pages[PageClass] = page
-            page.grid(row=0, column=0, sticky="nsew")
-
         self.show_page(SystemModelPage)
 
         # Add variables to store dss commands
@@ -417,8 +413,12 @@ class App(tk.Tk):
         self.final_path = ""
 
     def show_page(self, page_class):
-        page = self.pages[page_class]
-        page.tkraise()
+        if page_class not in self.pages:
+            page = page_class(self.container)
+            page.grid(row=0, column=0, sticky="nsew")
+            self.pages[page_class] = page
+
+        self.pages[page_class].tkraise()
 
     # navigation commands
     def show_system_model(self):
@@ -441,7 +441,7 @@ class SystemModelPage(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg="white")
 
-        title = tk.Label(self, text="System Model Interface", font=("Arial", 20), bg="white", fg="black")
+        title = ttk.Label(self, text="System Model Interface", style="Title.TLabel")
         title.pack(pady=20)
 
         # inputs
@@ -506,7 +506,7 @@ class DERSettingsPage(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg="white")
 
-        title = tk.Label(self, text="DER & Protection Settings", font=("Arial", 20), bg="white", fg="black")
+        title = ttk.Label(self, text="DER & Protection Settings", style="Title.TLabel")
         title.pack(pady=20)
 
         # inputs
@@ -564,7 +564,7 @@ class DERSettingsManualPage(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg="white")
 
-        title = tk.Label(self, text="DER & Protection Settings", font=("Arial", 20), bg="white", fg="black")
+        title = ttk.Label(self, text="DER & Protection Settings", style="Title.TLabel")
         title.pack(pady=20)
 
         form = tk.Frame(self, bg="white")
@@ -624,7 +624,7 @@ class FaultScenarioPage(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg="white")
 
-        title = tk.Label(self, text="Fault Scenario Selection", font=("Arial", 20), bg="white", fg="black")
+        title = ttk.Label(self, text="Fault Scenario Selection", style="Title.TLabel")
         title.pack(pady=20)
 
         form = tk.Frame(self, bg="white")
@@ -671,7 +671,7 @@ class RunSimulationPage(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg="white")
 
-        title = tk.Label(self, text="Run Simulation (Octave Integration)", font=("Arial", 20), bg="white", fg="black")
+        title = ttk.Label(self, text="Run Simulation (Octave Integration)", style="Title.TLabel")
         title.pack(pady=20)
 
         self.status = tk.Label(self, text="Ready to run simulation.", bg="white", fg="black")
@@ -689,7 +689,7 @@ class ResultsPage(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg="white")
 
-        title = tk.Label(self, text="Results & Arc-Flash Outputs", font=("Arial", 20), bg="white", fg="black")
+        title = ttk.Label(self, text="Results & Arc-Flash Outputs", style="Title.TLabel")
         title.pack(pady=20)
 
         self.results_label = tk.Label(self, text={"Results will be shown here (plots, tables, etc.)."}, bg="white", fg="black")